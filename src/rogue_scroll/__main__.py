@@ -28,6 +28,9 @@ DEFAULT_N = 1  # Scroll titles to generate
 DEFAULT_K = False
 DEFAULT_BIG_K = False
 
+# Scrolls generated per write when producing output
+BATCH_SIZE = 10_000
+
 
 class _CombinedArgParseFormatter(
     argparse.ArgumentDefaultsHelpFormatter,
@@ -137,22 +140,28 @@ def main() -> None:
         separator=args.syllable_divider,
     )
 
-    for _ in range(args.n):
-        kind = ""
-        title = ""
-        output = ""
-        if not args.K:
-            title = generator.random_title()
-        if args.k or args.K:
-            kind = Generator.random_kind()
+    # The output format is matched once per batch, not for each scroll.
+    # Scrolls are generated and written in fixed-size batches. That is
+    # faster than one at a time while keeping memory use bounded.
+    remaining = args.n
+    while remaining > 0:
+        batch = min(remaining, BATCH_SIZE)
+        remaining -= batch
+
+        lines: list[str]
         match args.k, args.K:
             case False, False:
-                output = title
+                lines = generator.random_titles(batch)
             case True, False:
-                output = f"{title} [{kind}]"
-            case _, True:
-                output = kind
-        print(output)
+                titles = generator.random_titles(batch)
+                kinds = Generator.random_kinds(batch)
+                lines = [
+                    f"{title} [{kind}]" for title, kind in zip(titles, kinds)
+                ]
+            case _:
+                lines = Generator.random_kinds(batch)
+
+        sys.stdout.write("\n".join(lines) + "\n")
 
     if args.entropy:
         print(generator.entropy())
@@ -11,19 +11,20 @@ Scrolls in the game had titles like
 This file can also be imported as a module
 """
 
-from bisect import bisect
-from itertools import accumulate
+from collections.abc import Sequence
 from typing import NamedTuple, Optional
 
 import secrets  # we will not use the RNG from original rogue.
+import functools
 import math
+import random
 
 
 class Constants:
     """A class for constants used in this module."""
 
     # spell-checker: disable
-    SYLLABLES: list[str] = [
+    SYLLABLES: tuple[str, ...] = (
         "a", "ab", "ag", "aks", "ala", "an", "app", "arg", "arze", "ash", "bek",
         "bie", "bit", "bjor", "blu", "bot", "bu", "byt", "comp", "con", "cos",
         "cre", "dalf", "dan", "den", "do", "e", "eep", "el", "eng", "er", "ere",
@@ -40,7 +41,7 @@ class Constants:
         "ur", "val", "viv", "vly", "vom", "wah", "wed", "werg", "wex", 
         "whon", "wun", "xo", "y", "yot", "yu", "zant", "zeb", "zim",
         "zok", "zon", "zum",
-      ]  # fmt: skip
+      )  # fmt: skip
     # spell-checker: enable
     """Syllables taken from rogue source.
 
@@ -89,13 +90,90 @@ class Constants:
     """Number of different scrolls"""
 
 
+def _randbelow_many(n: int, k: int) -> list[int]:
+    """Returns k independent random integers uniformly chosen from [0, n).
+
+    For n up to 65536 the randomness is drawn in bulk from
+    :func:`secrets.token_bytes`, with rejection sampling so that results
+    are unbiased. Larger n fall back to :func:`secrets.randbelow`.
+    """
+
+    if n > 1 << 16:
+        return [secrets.randbelow(n) for _ in range(k)]
+
+    # Random values are read as bytes or as 16 bit unsigned integers.
+    width = 1 if n <= 256 else 2
+    space = 1 << (8 * width)
+
+    # Largest multiple of n that fits in a value. Values at or above it
+    # are rejected, as using them would bias the result.
+    limit = (space // n) * n
+    result: list[int] = []
+    while len(result) < k:
+        needed = k - len(result)
+        # Draw a bit more than needed to allow for rejected values.
+        buf = secrets.token_bytes(width * (needed * space // limit + 16))
+        values = buf if width == 1 else memoryview(buf).cast("H")
+        result += [v % n for v in values if v < limit]
+    del result[k:]
+    return result
+
+
 class _PreComputed(NamedTuple):
-    scroll_types: list[str]
-    cum_weights: list[int]
-    hi: int
+    scroll_types: tuple[str, ...]
+    thresholds: tuple[int, ...]
+    aliases: tuple[int, ...]
     total: int
 
 
+def _alias_table(
+    weights: Sequence[int],
+) -> tuple[tuple[int, ...], tuple[int, ...]]:
+    """Builds (thresholds, aliases) for Walker's alias method.
+
+    This is Vose's construction done entirely with integers,
+    so sampling from the table is exact.
+    Each of the n buckets has capacity sum(weights).
+    Given bucket i chosen uniformly and u uniform in [0, sum(weights)),
+    the pick is i if u < thresholds[i] else aliases[i].
+    """
+
+    n = len(weights)
+    total = sum(weights)
+    scaled = [w * n for w in weights]
+    thresholds = [total] * n
+    aliases = list(range(n))
+
+    small = [i for i, s in enumerate(scaled) if s < total]
+    large = [i for i, s in enumerate(scaled) if s >= total]
+    while small and large:
+        lo = small.pop()
+        hi = large.pop()
+        thresholds[lo] = scaled[lo]
+        aliases[lo] = hi
+        # hi gives up what it takes to fill lo's bucket
+        scaled[hi] -= total - scaled[lo]
+        if scaled[hi] < total:
+            small.append(hi)
+        else:
+            large.append(hi)
+
+    return tuple(thresholds), tuple(aliases)
+
+
+def _kind_table() -> _PreComputed:
+    """Builds the table random_kind() samples scroll kinds from."""
+
+    weights = tuple(Constants.SCROLL_PROBS.values())
+    thresholds, aliases = _alias_table(weights)
+    return _PreComputed(
+        scroll_types=Constants.SCROLL_KINDS,
+        thresholds=thresholds,
+        aliases=aliases,
+        total=sum(weights),
+    )
+
+
 class Scroll:
     """A scroll as a title and a kind"""
 
@@ -136,12 +214,25 @@ class Scroll:
 
 
 class Generator:
-    """Rogue scroll information."""
+    """Rogue scroll information.
+
+    By default randomness comes from the :mod:`secrets` module.
+    A :class:`random.Random` instance may be passed as ``rng`` to use
+    instead, which is faster.
+    Unless that is a :class:`random.SystemRandom`,
+    titles generated that way must not be used as passwords.
+
+    The ``rng`` given here is used by :meth:`random_title`,
+    :meth:`random_titles` and :meth:`random`.
+    :meth:`random_kind` and :meth:`random_kinds` are class methods,
+    so they use :mod:`secrets` unless given their own ``rng`` argument,
+    even when called on an instance.
+
+    :raises ValueError: if min_syllables or min_words is negative.
+    """
 
     # syllables from https://github.com/Davidslv/rogue/blob/master/init.c#L114
     # spell-checker: disable
-    # None is used as a sentinel for not yet computed
-    _precomp: _PreComputed | None = None
 
     # Defaults taken from hardcoded values in rogue source.
     DEFAULT_MIN_S = 1  #: Minimum syllables per word
@@ -163,6 +254,9 @@ class Generator:
         k: i for i, k in enumerate(Constants.SCROLL_KINDS)
     }
 
+    # Used in every call to random_kind(), so computed once at import
+    _KIND_TABLE: _PreComputed = _kind_table()
+
     def __init__(
         self,
         min_syllables: int = DEFAULT_MIN_S,
@@ -170,12 +264,20 @@ class Generator:
         min_words: int = DEFAULT_MIN_W,
         max_words: int = DEFAULT_MAX_W,
         separator: str = DEFAULT_SEPARATOR,
+        rng: random.Random | None = None,
     ) -> None:
+        # Validated once here, so generation doesn't need to check.
+        if min_syllables < 0:
+            raise ValueError("min_syllables can't be negative")
+        if min_words < 0:
+            raise ValueError("min_words can't be negative")
+
         self._s_max = max(min_syllables, max_syllables)
         self._s_min = min_syllables
         self._w_max = max(min_words, max_words)
         self._w_min = min_words
         self._separator = separator
+        self._rng = rng
 
         # Inclusive differences
         self._s_diff = (self._s_max - self._s_min) + 1
@@ -184,73 +286,124 @@ class Generator:
         self._entropy: float | None = None
 
     @classmethod
-    def _precompute_choose(cls) -> _PreComputed:
-        """Precomputes things that will be used in every call to choose()"""
-        if cls._precomp is None:
-            scroll_types = list(Constants.SCROLL_PROBS.keys())
-            weights = Constants.SCROLL_PROBS.values()
-            cum_weights = list(accumulate(weights))
-            total = cum_weights[-1]
-            hi = Constants.N_SCROLLS - 1
-
-            cls._precomp = _PreComputed(
-                scroll_types=scroll_types,
-                cum_weights=cum_weights,
-                total=total,
-                hi=hi,
-            )
-        return cls._precomp
+    def random_kind(cls, rng: random.Random | None = None) -> str:
+        """Randomly picks a scroll kind using weighted probabilities.
+
+        If ``rng`` is given it is used instead of the :mod:`secrets` module.
+        """
+
+        scroll_types, _, _, total = cls._KIND_TABLE
+        space = len(scroll_types) * total
+        if rng is None:
+            r = secrets.randbelow(space)
+        else:
+            r = rng.randrange(space)
+        return cls._kind_from_draw(r)
 
     @classmethod
-    def random_kind(cls) -> str:
-        """Randomly picks a scroll kind using weighted probabilities."""
+    def _kind_from_draw(cls, r: int) -> str:
+        """Scroll kind for r in [0, k * total) from the alias table."""
 
-        # largely lifted from
-        # https://github.com/python/cpython/blob/bbfae4a912f021be44f270a63565a0bc2d156e9f/Lib/random.py#L458
-        # But we are dealing with integers only,
-        # and I am using lots of intermediate variables
+        # Walker's alias method. A single random number
+        # picks both the bucket and where within it we land.
+        scroll_types, thresholds, aliases, total = cls._KIND_TABLE
+        i, u = divmod(r, total)
+        if u < thresholds[i]:
+            return scroll_types[i]
+        return scroll_types[aliases[i]]
 
-        pc = cls._precompute_choose()
+    @classmethod
+    def random_kinds(
+        cls, n: int, rng: random.Random | None = None
+    ) -> list[str]:
+        """Randomly picks n scroll kinds using weighted probabilities.
+
+        This is faster than calling :meth:`random_kind` n times.
+        If ``rng`` is given it is used instead of the :mod:`secrets` module.
+
+        :raises ValueError: if n is negative.
+        """
 
-        r = secrets.randbelow(pc.total)
-        position = bisect(pc.cum_weights, r, 0, pc.hi)
-        return pc.scroll_types[position]
+        if n < 0:
+            raise ValueError("n can't be negative")
+
+        scroll_types, _, _, total = cls._KIND_TABLE
+        space = len(scroll_types) * total
+        rs: list[int]
+        if rng is None:
+            rs = _randbelow_many(space, n)
+        else:
+            randrange = rng.randrange
+            rs = [randrange(space) for _ in range(n)]
+
+        kind_from_draw = cls._kind_from_draw
+        return [kind_from_draw(r) for r in rs]
+
+    def _random_indices(self, n: int, k: int) -> list[int]:
+        """k random integers in [0, n) from this generator's randomness."""
+
+        if self._rng is None:
+            return _randbelow_many(n, k)
+        return self._rng.choices(range(n), k=k)
 
     def random_title(self) -> str:
         """Generate random scroll title."""
 
-        n_words: int
+        return self.random_titles(1)[0]
+
+    def random_titles(self, n: int) -> list[str]:
+        """Generate n random scroll titles.
+
+        This is faster than calling :meth:`random_title` n times,
+        as random numbers for all of the titles are drawn together.
+
+        :raises ValueError: if n is negative.
+        """
+
+        if n < 0:
+            raise ValueError("n can't be negative")
+
+        w_min = self._w_min
+        word_counts: list[int]
         if self._w_diff == 1:
-            n_words = self._w_min
+            word_counts = [w_min] * n
         else:
-            n_words = secrets.randbelow(self._w_diff) + self._w_min
+            word_counts = [
+                d + w_min for d in self._random_indices(self._w_diff, n)
+            ]
+        n_words = sum(word_counts)
 
         # If the number of syllables will be fixed as a single number,
-        # we only compute that once.
-        fixed_n_syl = False
-        n_syllables = -1  # I wish PEP 661 was adopted
+        # we don't need to draw it for each word.
+        s_min = self._s_min
+        syl_counts: list[int]
         if self._s_diff == 1:
-            n_syllables = self._s_min
-            fixed_n_syl = True
+            syl_counts = [s_min] * n_words
         else:
-            # We will need to compute n_syllables for each word in the
-            # loop below.
-            fixed_n_syl = False
+            syl_counts = [
+                d + s_min for d in self._random_indices(self._s_diff, n_words)
+            ]
 
-        words: list[str] = []
-        for w in range(n_words):
-            if not fixed_n_syl:
-                n_syllables = secrets.randbelow(self._s_diff) + self._s_min
-            syllables: list[str] = []
-            for s in range(n_syllables):
-                syl = Constants.SYLLABLES[
-                    secrets.randbelow(Constants.N_SYLLABLES)
-                ]
-                syllables.append(syl)
-            word = self._separator.join(syllables)
+        # All syllable indices are drawn in one batch
+        indices = self._random_indices(Constants.N_SYLLABLES, sum(syl_counts))
 
+        syllables = Constants.SYLLABLES
+        separator = self._separator
+        words: list[str] = []
+        p = 0
+        for n_syllables in syl_counts:
+            word = separator.join(
+                [syllables[i] for i in indices[p : p + n_syllables]]
+            )
+            p += n_syllables
             words.append(word)
-        return " ".join(words)
+
+        titles: list[str] = []
+        p = 0
+        for count in word_counts:
+            titles.append(" ".join(words[p : p + count]))
+            p += count
+        return titles
 
     def random(self, with_entropy: bool = False) -> Scroll:
         """Generate a random Scroll.
@@ -260,12 +413,13 @@ class Generator:
         """
 
         title = self.random_title()
-        kind = self.random_kind()
+        kind = self.random_kind(self._rng)
         k_idx = self._KIND_INDECES[kind]
         entropy = self.entropy() if with_entropy else None
         return Scroll(title, k_idx, entropy=entropy)
 
     @staticmethod
+    @functools.lru_cache(maxsize=128)
     def count_possibilities(n: int, min: int, max: int) -> int:
         """:math:`\\displaystyle\\sum_{x=\\mathrm{min}}^{\\mathrm{max}} n^x`
 
@@ -273,41 +427,71 @@ class Generator:
         take the logarithm of the result.
 
         :raises ValueError: if min > max.
+        :raise ValueError: if min < 0.
         :raise ValueError: if n < 1.
         """
 
         if max < min:
             raise ValueError("Minimum can't be greater than maximum.")
 
+        if min < 0:
+            raise ValueError("Minimum can't be negative.")
+
         if n < 1:
             raise ValueError("n must be positive")
 
-        total = 0
-        for length in range(min, max + 1):
-            total += n**length
+        if n == 1:
+            return max - min + 1
+
+        # Closed form of the geometric series
+        total: int = (n ** (max + 1) - n**min) // (n - 1)
         return total
 
-    def entropy(self) -> float:
-        """Entropy in bits.
+    @staticmethod
+    def _log2_count_possibilities(n: int, min: int, max: int) -> float:
+        """:math:`\\log_2` of :meth:`count_possibilities` without computing it.
 
-        :raises ValueError: if no titles would be possible
+        Factoring out :math:`n^\\mathrm{max}` leaves a geometric series in
+        :math:`1/n`, which is small and can be summed as floats.
+        This avoids building (and then taking the logarithm of)
+        an enormous integer.
         """
 
+        if max < min:
+            raise ValueError("Minimum can't be greater than maximum.")
+
+        if min < 0:
+            raise ValueError("Minimum can't be negative.")
+
+        if n < 1:
+            raise ValueError("n must be positive")
+
+        if n == 1:
+            return math.log2(max - min + 1)
+
+        r = 1 / n
+        tail: list[float] = []
+        term = 1.0
+        for _ in range(max - min + 1):
+            tail.append(term)
+            term *= r
+            # Remaining terms can no longer change a double
+            if term < 2**-60:
+                break
+        return max * math.log2(n) + math.log2(math.fsum(tail))
+
+    def entropy(self) -> float:
+        """Entropy in bits."""
+
         if self._entropy is not None:
             return self._entropy
 
-        # This code assumes that the maximum number of syllables per words
-        # and words per syllables will remain small.
-        # With larger numbers there would be more efficient ways to do this.
+        # This code assumes that the maximum number of syllables per word
+        # will remain small, as words is computed exactly.
         words = self.count_possibilities(
             Constants.N_SYLLABLES, self._s_min, self._s_max
         )
-        titles = self.count_possibilities(words, self._w_min, self._w_max)
-
-        try:
-            H = math.log2(titles)
-        except ValueError:
-            raise
+        H = self._log2_count_possibilities(words, self._w_min, self._w_max)
 
         self._entropy = H
         return self._entropy
@@ -3,6 +3,8 @@ This file includes extremely expensive and probabilistic sanity checks.
 It should not be run as part of any automated thing.
 """
 
+from collections import Counter
+
 from rogue_scroll import Generator, Constants
 import pandas as pd
 import seaborn as sns
@@ -14,12 +16,9 @@ SCROLL_PROBS = Constants.SCROLL_PROBS
 
 
 def scroll_historgram(trials: int = 1000) -> dict[str, int]:
-    hist = {s: 0 for s in SCROLL_PROBS.keys()}
-
-    for _ in range(trials):
-        s = Generator.random_kind()
-        hist[s] = hist[s] + 1
-    return hist
+    counts = Counter(Generator.random_kinds(trials))
+    # Kinds that were never picked still need an entry
+    return {s: counts[s] for s in SCROLL_PROBS.keys()}
 
 
 class DistData:
@@ -40,11 +39,10 @@ class DistData:
     def df_wide(self) -> pd.DataFrame:
         if self._df_wide is not None:
             return self._df_wide
-        d: dict[str, list[str | float]] = dict()
-        d["scroll_type"] = [s for s in self.data.keys()]
-        d["count"] = [v[0] for v in self.data.values()]
-        d["expected"] = [v[1] for v in self.data.values()]
-        self._df_wide = pd.DataFrame(d)
+        self._df_wide = pd.DataFrame.from_records(
+            [(s, c, e) for s, (c, e) in self.data.items()],
+            columns=["scroll_type", "count", "expected"],
+        )
         return self._df_wide
 
     @property
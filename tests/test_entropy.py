@@ -0,0 +1,62 @@
+import math
+import sys
+import pytest
+
+import rogue_scroll as rs
+
+
+class TestCountPossibilities:
+    def test_against_sum(self) -> None:
+        for n in range(1, 20):
+            for min in range(5):
+                for max in range(min, 8):
+                    expected = sum(n**x for x in range(min, max + 1))
+                    got = rs.Generator.count_possibilities(n, min, max)
+                    assert got == expected
+
+    def test_min_gt_max(self) -> None:
+        with pytest.raises(ValueError):
+            rs.Generator.count_possibilities(10, 3, 2)
+
+    def test_min_lt_zero(self) -> None:
+        with pytest.raises(ValueError):
+            rs.Generator.count_possibilities(2, -1, 1)
+
+    def test_n_lt_one(self) -> None:
+        with pytest.raises(ValueError):
+            rs.Generator.count_possibilities(0, 1, 2)
+
+
+class TestLog2CountPossibilities:
+    def test_against_exact(self) -> None:
+        for n in [1, 2, 3, 147, 147**3, 2**100]:
+            for min in range(5):
+                for max in range(min, 8):
+                    exact = rs.Generator.count_possibilities(n, min, max)
+                    got = rs.Generator._log2_count_possibilities(n, min, max)
+                    assert got == pytest.approx(math.log2(exact))
+
+    def test_min_lt_zero(self) -> None:
+        with pytest.raises(ValueError):
+            rs.Generator._log2_count_possibilities(2, -1, 1)
+
+
+class TestEntropy:
+    def test_default(self) -> None:
+        g = rs.Generator()
+        assert g.entropy() == pytest.approx(86.43545791624923)
+
+    def test_fixed(self) -> None:
+        g = rs.Generator(
+            min_syllables=3, max_syllables=3, min_words=4, max_words=4
+        )
+        expected = 12 * math.log2(rs.Constants.N_SYLLABLES)
+        assert g.entropy() == pytest.approx(expected)
+
+    def test_zero_words(self) -> None:
+        g = rs.Generator(min_words=0, max_words=0)
+        assert g.entropy() == 0.0
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main(args=[__file__]))
@@ -0,0 +1,60 @@
+import sys
+import pytest
+
+import rogue_scroll as rs
+from rogue_scroll._scroll import _alias_table, _randbelow_many
+
+
+def table_weights(weights: list[int]) -> list[int]:
+    """Weights, scaled by len(weights), implied by an alias table."""
+
+    total = sum(weights)
+    thresholds, aliases = _alias_table(weights)
+    implied = [0] * len(weights)
+    for i, (t, a) in enumerate(zip(thresholds, aliases)):
+        implied[i] += t
+        implied[a] += total - t
+    return implied
+
+
+class TestAliasTable:
+    def test_scroll_probs(self) -> None:
+        weights = list(rs.Constants.SCROLL_PROBS.values())
+        n = len(weights)
+        assert table_weights(weights) == [w * n for w in weights]
+
+    def test_uneven(self) -> None:
+        for weights in [[1], [1, 1], [5, 1], [1, 2, 3, 4], [0, 3, 0, 7]]:
+            n = len(weights)
+            assert table_weights(weights) == [w * n for w in weights]
+
+
+class TestRandomKind:
+    def test_is_kind(self) -> None:
+        trials = 100
+        for _ in range(trials):
+            assert rs.Generator.random_kind() in rs.Constants.SCROLL_KINDS
+
+    def test_kinds_count(self) -> None:
+        for n in range(10):
+            kinds = rs.Generator.random_kinds(n)
+            assert len(kinds) == n
+            for k in kinds:
+                assert k in rs.Constants.SCROLL_KINDS
+
+    def test_kinds_negative(self) -> None:
+        with pytest.raises(ValueError):
+            rs.Generator.random_kinds(-1)
+
+
+class TestRandbelowMany:
+    def test_in_range(self) -> None:
+        for n in [1, 2, 147, 255, 256, 257, 1800, 65536, 65537]:
+            values = _randbelow_many(n, 200)
+            assert len(values) == 200
+            for v in values:
+                assert 0 <= v < n
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main(args=[__file__]))
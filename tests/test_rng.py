@@ -0,0 +1,70 @@
+import random
+import sys
+import pytest
+
+import rogue_scroll as rs
+
+
+class TestSuppliedRng:
+    def test_reproducible(self) -> None:
+        trials = 20
+        g1 = rs.Generator(rng=random.Random(1234))
+        g2 = rs.Generator(rng=random.Random(1234))
+        for _ in range(trials):
+            assert g1.random_title() == g2.random_title()
+
+    def test_syllables(self) -> None:
+        trials = 20
+        g = rs.Generator(
+            min_syllables=1,
+            max_syllables=5,
+            min_words=1,
+            max_words=5,
+            separator="-",
+            rng=random.Random(),
+        )
+        for _ in range(trials):
+            title = g.random_title()
+            words = title.split(" ")
+            assert 1 <= len(words) <= 5
+            for word in words:
+                syllables = word.split("-")
+                assert 1 <= len(syllables) <= 5
+                for s in syllables:
+                    assert s in rs.Constants.SYLLABLES
+
+    def test_kind(self) -> None:
+        trials = 20
+        rng = random.Random()
+        for _ in range(trials):
+            kind = rs.Generator.random_kind(rng)
+            assert kind in rs.Constants.SCROLL_KINDS
+
+    def test_scroll_reproducible(self) -> None:
+        trials = 20
+        g1 = rs.Generator(rng=random.Random(99))
+        g2 = rs.Generator(rng=random.Random(99))
+        for _ in range(trials):
+            s1 = g1.random()
+            s2 = g2.random()
+            assert (s1.title, s1.kind) == (s2.title, s2.kind)
+
+    def test_kinds_ignore_instance_rng(self) -> None:
+        # random_kind(s) are classmethods, so a Generator's own rng
+        # is not used by them. Only random() passes it along.
+        rng = random.Random(7)
+        state = rng.getstate()
+        g = rs.Generator(rng=rng)
+        g.random_kind()
+        g.random_kinds(20)
+        assert rng.getstate() == state
+
+    def test_kinds_explicit_rng(self) -> None:
+        trials = 20
+        kinds1 = rs.Generator.random_kinds(trials, random.Random(7))
+        kinds2 = rs.Generator.random_kinds(trials, random.Random(7))
+        assert kinds1 == kinds2
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main(args=[__file__]))
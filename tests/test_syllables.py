@@ -117,5 +117,11 @@ class TestZeroSyllables:
             assert s == ""
 
 
+class TestNegativeSyllables:
+    def test_min_lt_zero(self) -> None:
+        with pytest.raises(ValueError):
+            rs.Generator(min_syllables=-1)
+
+
 if __name__ == "__main__":
     sys.exit(pytest.main(args=[__file__]))
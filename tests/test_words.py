@@ -67,5 +67,31 @@ class TestZeroWords:
             assert s == ""
 
 
+class TestNegativeWords:
+    def test_min_lt_zero(self) -> None:
+        with pytest.raises(ValueError):
+            rs.Generator(min_words=-1)
+
+
+class TestRandomTitles:
+    def test_count(self) -> None:
+        g = rs.Generator()
+        for n in range(10):
+            assert len(g.random_titles(n)) == n
+
+    def test_words(self) -> None:
+        g = rs.Generator(
+            min_syllables=1, max_syllables=1, min_words=2, max_words=5
+        )
+        for s in g.random_titles(50):
+            n = s.count(" ") + 1
+            assert 2 <= n <= 5
+
+    def test_negative(self) -> None:
+        g = rs.Generator()
+        with pytest.raises(ValueError):
+            g.random_titles(-1)
+
+
 if __name__ == "__main__":
     sys.exit(pytest.main(args=[__file__]))